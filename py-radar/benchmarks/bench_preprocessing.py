@@ -0,0 +1,71 @@
+# ==============================================================================
+# benchmarks/bench_preprocessing.py
+# ==============================================================================
+# Uso (desde py-radar/):  python -m benchmarks.bench_preprocessing
+import contextlib
+import os
+import queue
+import time
+import tracemalloc
+from config.radar_config import RadarConfig
+from hardware.synthetic_source import SyntheticArraySource
+from processing.radar_processor import RadarProcessor
+
+N_FRAMES = 300
+ARRAY_PORTS = (("COM9", "COM10"), ("COM11", "COM12"), ("COM13", "COM14"))
+
+def make_processor(array_ports=(), use_numba=False):
+    """RadarProcessor (sin hilos) y tramas sintéticas para su configuración"""
+    config = RadarConfig(array_ports=array_ports, use_numba=use_numba,
+                         synthetic_targets=((1.5, 0.2, 20.0), (3.0, -0.3, -30.0)))
+    queues = [(queue.Queue(), queue.Queue()) for _ in range(config.n_rx)]
+    processor = RadarProcessor(config, queues[0][0], queues[0][1], queue.Queue(), None, queues[1:])
+    processor.signal_processor.warm_up()
+    source = SyntheticArraySource(config, queues, seed=0)
+    frames = [source.generate_frame() for _ in range(N_FRAMES)]
+    return processor, frames
+
+def process(processor: RadarProcessor, frame):
+    """Camino en vivo por trama: _process_iq_data completo"""
+    (data_I, data_Q), array_data = frame[0], [list(channel) for channel in frame[1:]]
+    return processor._process_iq_data(data_I, data_Q, array_data)
+
+def measure(processor: RadarProcessor, frames):
+    """
+    Bytes asignados por trama (pico sobre la memoria previa) y tiempo por trama
+    Incluye RadarResults y lo que imprime _print_results (stdout a /dev/null)
+    """
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        process(processor, frames[0])  # Calentamiento
+
+        total = 0
+        tracemalloc.start()
+        for frame in frames:
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            results = process(processor, frame)
+            total += tracemalloc.get_traced_memory()[1] - before
+            del results
+        tracemalloc.stop()
+
+        t0 = time.perf_counter()
+        for frame in frames:
+            process(processor, frame)
+        elapsed = (time.perf_counter() - t0) / len(frames)
+    return total // len(frames), elapsed
+
+def main():
+    print(f"Tramas: {N_FRAMES}, _process_iq_data por trama (2 blancos)")
+    for name, array_ports in (("1 canal", ()), (f"{len(ARRAY_PORTS) + 1} canales (AoA)", ARRAY_PORTS)):
+        for use_numba in (False, True):
+            processor, frames = make_processor(array_ports, use_numba)
+            if use_numba and processor.signal_processor.preprocessor._kernel is None:
+                print(f"{name:<18} Numba   (no instalado)")
+                continue
+            allocated, elapsed = measure(processor, frames)
+            kernel = "Numba" if use_numba else "NumPy"
+            print(f"{name:<18} {kernel:<7} bytes/trama = {allocated:7d} B   "
+                  f"tiempo/trama = {elapsed * 1e6:7.1f} us")
+
+if __name__ == "__main__":
+    main()
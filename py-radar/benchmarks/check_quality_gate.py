@@ -0,0 +1,76 @@
+# ==============================================================================
+# benchmarks/check_quality_gate.py
+# ==============================================================================
+# Uso (desde py-radar/):  python -m benchmarks.check_quality_gate
+import queue
+import sys
+import numpy as np
+from config.radar_config import RadarConfig
+from core.quality import DataQualityGate
+from hardware.synthetic_source import SyntheticArraySource
+
+ARRAY_PORTS = (("COM9", "COM10"), ("COM11", "COM12"), ("COM13", "COM14"))
+N_FRAMES = 40
+
+def make_source(array_ports, targets, seed=0) -> SyntheticArraySource:
+    """Fuente sintética sin hilos para la escena indicada"""
+    config = RadarConfig(array_ports=array_ports, synthetic_targets=targets)
+    queues = [(queue.Queue(), queue.Queue()) for _ in range(config.n_rx)]
+    return SyntheticArraySource(config, queues, seed=seed)
+
+def make_gate(config: RadarConfig) -> DataQualityGate:
+    return DataQualityGate(
+        config.adc_min, config.adc_max, config.quality_max_rail_run,
+        config.quality_max_clip_ratio, config.quality_min_std, config.quality_std_ratio,
+        config.quality_action
+    )
+
+def scene_frames(array_ports):
+    """Solo ruido -> entra un blanco a 1.5 m -> sale el blanco"""
+    empty = make_source(array_ports, (), seed=1)
+    target = make_source(array_ports, ((1.5, 0.2, 20.0),), seed=2)
+    return ([empty.generate_frame() for _ in range(N_FRAMES)]
+            + [target.generate_frame() for _ in range(N_FRAMES)]
+            + [empty.generate_frame() for _ in range(N_FRAMES)])
+
+def scale(frame, channel, name, ramp, gain):
+    """Multiplica la parte AC de un chirp (falla inyectada)"""
+    data = frame[channel][0 if name == "I" else 1]
+    attr = "up_samples" if ramp == "up" else "down_samples"
+    samples = getattr(data, attr)
+    mean = samples.mean()
+    setattr(data, attr, np.round(mean + (samples - mean) * gain).astype(samples.dtype))
+
+def main() -> int:
+    failures = 0
+    for label, array_ports in (("1 canal", ()), (f"{len(ARRAY_PORTS) + 1} canales", ARRAY_PORTS)):
+        gate = make_gate(RadarConfig(array_ports=array_ports))
+
+        # Cambios de escena: no deben rechazarse tramas
+        rejected = [k for k, frame in enumerate(scene_frames(array_ports))
+                    if not gate.check(frame).valid]
+        ok = not rejected
+        failures += not ok
+        print(f"{label:<11} blanco entra/sale: {len(rejected)} rechazadas  {'OK' if ok else 'FALLA'}")
+
+        # Fallas dentro de la trama: deben detectarse
+        source = make_source(array_ports, ((1.5, 0.2, 20.0),), seed=3)
+        # (nombre, chirps escalados (canal, I/Q, rampa, ganancia), motivo esperado)
+        faults = [("ráfaga en I subida", [(0, "I", "up", 8.0)], "varianza_alta"),
+                  ("Q atenuado", [(0, "Q", "up", 0.1)], "desbalance_iq"),
+                  ("bajada atenuada", [(0, "I", "down", 0.1), (0, "Q", "down", 0.1)], "desbalance_rampas")]
+        if array_ports:
+            faults.append(("canal 2 atenuado", [(2, iq, ramp, 0.1) for iq in "IQ" for ramp in ("up", "down")],
+                           "varianza_baja"))
+        for name, scaled, expected in faults:
+            frame = source.generate_frame()
+            for fault in scaled:
+                scale(frame, *fault)
+            reasons = gate.check(frame).reasons
+            ok = expected in reasons
+            failures += not ok
+            print(f"{label:<11} {name:<20} {','.join(reasons) or '-':<34} {'OK' if ok else 'FALLA'}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
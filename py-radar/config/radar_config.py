@@ -2,6 +2,7 @@
 # config/radar_config.py
 # ==============================================================================
 from dataclasses import dataclass
+from typing import Tuple
 
 @dataclass
 class RadarConfig:
@@ -26,20 +27,59 @@ class RadarConfig:
     velocity_threshold: float = 0.01  # m/s para detectar movimiento
     samples_per_ramp = 256 # Muestras a tomar para el procesamiento en cada rampa
     
+    # Control de calidad de datos (antes del DSP)
+    quality_action: str = "reject"    # "reject" descarta la trama, "flag" la publica marcada (otro valor: ValueError)
+    adc_min: int = 0                  # Rieles del ADC de 12 bits
+    adc_max: int = 4095
+    quality_max_rail_run: int = 8     # Muestras consecutivas en un riel (0 = timeout del ESP32)
+    quality_max_clip_ratio: float = 0.05  # Fracción máxima de muestras en los rieles
+    quality_min_std: float = 1.0      # Cuentas ADC - por debajo el canal está plano/muerto
+    quality_std_ratio: float = 4.0    # std de un chirp vs mediana de la trama (y I vs Q): > ratio o < 1/ratio
+
+    # Aceleradores opcionales (se cargan en segundo plano, fuera de la primera trama)
+    use_numba: bool = False           # Kernel Numba para DC/ventana/I+jQ
+
     # Tamaños de colas
     queue_size: int = 5
+    max_channel_skew: float = 0.05    # s - Diferencia máxima de timestamps entre canales de una trama
 
     # Display
     enable_display: bool = True  # Habilitar/deshabilitar salida a OLED
+    display_reset_wait: float = 2.0   # s - Espera tras abrir el puerto (reinicio del Arduino)
+
+    # Ejecución
+    headless: bool = False       # Sin visualización (no importa matplotlib)
+
+    # Arreglo de recepción (ángulo de llegada)
+    # Pares (puerto_I, puerto_Q) adicionales al canal de referencia (port_I, port_Q)
+    array_ports: Tuple[Tuple[str, str], ...] = ()
+    element_spacing: float = 0.5      # Separación entre elementos [longitudes de onda]
+    aoa_method: str = "bartlett"      # "bartlett" o "capon"
+    aoa_fov_deg: float = 60.0         # Campo de visión ±grados
+    aoa_n_angles: int = 121           # Puntos de la rejilla angular
+    capon_loading: float = 1e-2       # Carga diagonal relativa para Capon
+    capon_neighbors: int = 2          # Bins vecinos (±) para estimar la covarianza
+    max_targets: int = 4              # Picos por rampa (máximos locales)
+    peak_threshold: float = 0.25      # Umbral de pico relativo al máximo del espectro
+
+    # Datos sintéticos (sin hardware)
+    use_synthetic: bool = False
+    # Blancos simulados: (distancia [m], velocidad [m/s], azimut [grados])
+    synthetic_targets: Tuple[Tuple[float, float, float], ...] = ((1.5, 0.2, 20.0),)
+    synthetic_noise: float = 20.0     # Desviación estándar del ruido [cuentas ADC]
+    synthetic_period: float = 0.1     # s - Intervalo entre tramas simuladas
     
     # Calculados
     @property
     def T(self) -> float:
         """Duración del chirp"""
-        t =(1 / self.Fs) * self.N
-        print(f"Tiempo de chirp {t}")
-        return t
+        return (1 / self.Fs) * self.N
     
+    @property
+    def n_rx(self) -> int:
+        """Número de canales de recepción (referencia + arreglo)"""
+        return 1 + len(self.array_ports)
+
     @property
     def K(self) -> float:
         """Tasa de cambio de frecuencia"""
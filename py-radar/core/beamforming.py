@@ -0,0 +1,66 @@
+# ==============================================================================
+# core/beamforming.py
+# ==============================================================================
+import numpy as np
+from typing import Optional, Tuple
+
+class ArrayBeamformer:
+    """Estimación del ángulo de llegada en un arreglo lineal uniforme (ULA)"""
+
+    METHODS = ("bartlett", "capon")
+
+    def __init__(self, n_channels: int, spacing: float = 0.5, fov_deg: float = 60.0,
+                 n_angles: int = 121, method: str = "bartlett",
+                 loading: float = 1e-2, neighbors: int = 2):
+        if method not in self.METHODS:
+            raise ValueError(f"Método AoA desconocido: {method}")
+        self.n_channels = n_channels
+        self.method = method
+        self.loading = loading
+        self.neighbors = neighbors
+        self.angles = np.linspace(-fov_deg, fov_deg, n_angles)
+
+        # Matriz de steering (K x n_angles), calculada una sola vez
+        k = np.arange(n_channels)[:, None]
+        phase = 2 * np.pi * spacing * np.sin(np.deg2rad(self.angles))[None, :]
+        self.steering = np.exp(1j * k * phase)
+        self._steering_h = self.steering.conj().T
+
+    def estimate(self, spectra: np.ndarray, bins: np.ndarray,
+                 period: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Estima el azimut en los bins de rango detectados
+        spectra: espectros complejos por canal, forma (K, n_bins)
+        bins: índices de los bins detectados, forma (M,)
+        period: largo de cada espectro si spectra concatena varios (vecinos circulares)
+        Returns: (azimut por bin [grados], potencia angular (M, n_angles))
+        """
+        bins = np.atleast_1d(bins)
+        if self.method == "capon":
+            power = self._capon(spectra, bins, period or spectra.shape[1])
+        else:
+            power = self._bartlett(spectra, bins)
+        return self.angles[np.argmax(power, axis=1)], power
+
+    def _bartlett(self, spectra: np.ndarray, bins: np.ndarray) -> np.ndarray:
+        """P(θ) = |a(θ)^H x|^2 / K para todos los bins en un solo producto"""
+        snapshots = spectra[:, bins]                       # (K, M)
+        beams = self._steering_h @ snapshots               # (n_angles, M)
+        return (np.abs(beams) ** 2).T / self.n_channels
+
+    def _capon(self, spectra: np.ndarray, bins: np.ndarray, period: int) -> np.ndarray:
+        """P(θ) = 1 / (a(θ)^H R^-1 a(θ)), R estimada con bins vecinos"""
+        offsets = np.arange(-self.neighbors, self.neighbors + 1)
+        # Vecinos circulares dentro del mismo espectro (la FFT es periódica)
+        base = (bins // period) * period
+        idx = base[:, None] + (bins[:, None] % period + offsets[None, :]) % period
+        snapshots = np.transpose(spectra[:, idx], (1, 0, 2))           # (M, K, L)
+
+        # Covarianza espacial por bin con carga diagonal
+        R = snapshots @ snapshots.conj().transpose(0, 2, 1) / idx.shape[1]
+        trace = np.real(np.trace(R, axis1=1, axis2=2)) / self.n_channels
+        R += (self.loading * trace)[:, None, None] * np.eye(self.n_channels)
+
+        R_inv_a = np.linalg.solve(R, np.broadcast_to(self.steering, (len(bins),) + self.steering.shape))
+        denom = np.real(np.sum(self.steering.conj() * R_inv_a, axis=1))  # (M, n_angles)
+        return 1.0 / np.maximum(denom, np.finfo(float).tiny)
@@ -2,7 +2,7 @@
 # core/data_models.py
 # ==============================================================================
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional
 import numpy as np
 
 @dataclass
@@ -11,15 +11,36 @@ class ChannelData:
     channel_id: str  # 'I' o 'Q'
     up_samples: Optional[np.ndarray] = None
     down_samples: Optional[np.ndarray] = None
-    timestamp: float = 0.0
+    timestamp: float = 0.0  # time.monotonic() al recibir la rampa de subida
+
+@dataclass
+class QualityStats:
+    """Métricas de calidad de una trama I/Q (antes del DSP)"""
+    valid: bool
+    reasons: List[str]
+    # Métricas sobre todos los chirps (I/Q, subida/bajada, todos los canales)
+    zero_ratio: float            # Fracción de muestras en 0
+    clip_ratio: float            # Fracción de muestras en los rieles del ADC (0/4095)
+    max_rail_run: int            # Racha más larga de muestras en un riel
+    std: np.ndarray              # Desviación estándar por chirp
+    # Contadores acumulados del procesador
+    frames_checked: int = 0
+    frames_flagged: int = 0      # Inválidas pero procesadas y publicadas (quality_action = "flag")
+    frames_rejected: int = 0     # Descartadas antes del DSP
+
+@dataclass
+class RadarTarget:
+    """Un blanco detectado (par de picos subida/bajada)"""
+    f_up: float
+    f_down: float
+    distance: float
+    velocity: float
+    direction: str
+    azimuth: Optional[float] = None   # grados (solo con arreglo)
 
 @dataclass
 class RadarResults:
     """Resultados del procesamiento I/Q complejo"""
-    # Señales complejas
-    signal_up_complex: np.ndarray
-    signal_down_complex: np.ndarray
-    
     # Espectros
     spec_up: np.ndarray
     spec_down: np.ndarray
@@ -37,4 +58,24 @@ class RadarResults:
     I_up: np.ndarray
     Q_up: np.ndarray
     I_down: np.ndarray
-    Q_down: np.ndarray
\ No newline at end of file
+    Q_down: np.ndarray
+
+    # Ángulo de llegada (solo con arreglo de recepción)
+    azimuth: Optional[float] = None               # grados, blanco más fuerte
+    aoa_spectrum: Optional[np.ndarray] = None     # Potencia vs ángulo
+    aoa_angles: Optional[np.ndarray] = None       # Rejilla angular [grados]
+
+    # Todos los blancos detectados, del más fuerte al más débil
+    targets: Optional[List[RadarTarget]] = None
+
+    # Calidad de la trama (valid=False => resultados no confiables)
+    quality: Optional[QualityStats] = None
+
+    # Señales complejas: se arman solo si alguien las pide (el DSP no las necesita)
+    @property
+    def signal_up_complex(self) -> np.ndarray:
+        return self.I_up + 1j * self.Q_up
+
+    @property
+    def signal_down_complex(self) -> np.ndarray:
+        return self.I_down + 1j * self.Q_down
@@ -0,0 +1,108 @@
+# ==============================================================================
+# core/preprocessing.py
+# ==============================================================================
+import numpy as np
+from typing import Optional
+
+def _compile_numba_kernel():
+    """
+    Importa Numba (opcional) y define el kernel fusionado
+    Costoso (importación + compilación JIT): llamar solo desde warm_up
+    Returns: el kernel, o None si Numba no está instalado
+    """
+    try:
+        import numba
+    except ImportError:
+        return None
+
+    @numba.njit(cache=True, nogil=True)
+    def iq_kernel(i_samples, q_samples, window, out):
+        """Remueve DC, aplica ventana y combina I+jQ en una sola pasada"""
+        n = i_samples.shape[0]
+        mean_i = 0.0
+        mean_q = 0.0
+        for k in range(n):
+            mean_i += i_samples[k]
+            mean_q += q_samples[k]
+        mean_i /= n
+        mean_q /= n
+        for k in range(n):
+            out[k] = complex((i_samples[k] - mean_i) * window[k],
+                             (q_samples[k] - mean_q) * window[k])
+
+    return iq_kernel
+
+class IQPreprocessor:
+    """
+    Preprocesado sin asignaciones: I/Q (int16/float32) -> complex64 sin DC y con ventana
+    Escribe en un buffer reutilizable de fft_size muestras; la cola queda en cero
+    y sirve directamente como entrada de la FFT con zero padding (incluso en el lugar)
+    """
+
+    def __init__(self, n_samples: int, fft_size: int, use_numba: bool = False):
+        self.fft_size = fft_size
+        self.use_numba = use_numba
+        self._kernel = None  # Kernel Numba, disponible después de warm_up
+        self._allocate(n_samples)
+
+    def warm_up(self):
+        """
+        Importa y compila el kernel Numba (si use_numba)
+        Mientras no termine, process usa el camino NumPy con out=
+        """
+        if not self.use_numba or self._kernel is not None:
+            return
+        kernel = _compile_numba_kernel()
+        if kernel is None:
+            print("[PROC] WARNING: Numba no está instalado, se usa NumPy")
+            self.use_numba = False
+            return
+        # Compilar para los tipos de entrada habituales (float32 del parser, int16 crudo)
+        out = np.zeros(self.fft_size, dtype=np.complex64)
+        window = np.ones(4, dtype=np.float32)
+        for dtype in (np.float32, np.int16):
+            samples = np.zeros(4, dtype=dtype)
+            kernel(samples, samples, window, out)
+        self._kernel = kernel
+
+    def process(self, i_samples: np.ndarray, q_samples: np.ndarray,
+                out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Preprocesa un chirp en out (complex64 contiguo de fft_size) o en el buffer interno
+        Returns: el arreglo escrito, válido hasta la siguiente llamada
+        """
+        if len(i_samples) != self.n_samples:
+            self._allocate(len(i_samples))
+        if out is None:
+            out, real, imag = self.buffer, self._real, self._imag
+        else:
+            interleaved = out.view(np.float32)
+            real = interleaved[0:2 * self.n_samples:2]
+            imag = interleaved[1:2 * self.n_samples:2]
+
+        # La FFT puede sobrescribir el buffer: se restaura el zero padding
+        out[self.n_samples:] = 0
+        kernel = self._kernel
+        if kernel is not None:
+            kernel(i_samples, q_samples, self.window, out)
+        else:
+            self._process_numpy(i_samples, real)
+            self._process_numpy(q_samples, imag)
+        return out
+
+    def _process_numpy(self, samples: np.ndarray, out: np.ndarray):
+        """(x - media) * ventana escrito directamente en out"""
+        np.subtract(samples, np.float32(samples.mean()), out=out, casting="unsafe")
+        np.multiply(out, self.window, out=out)
+
+    def _allocate(self, n_samples: int):
+        """Crea ventana, buffer y vistas para chirps de n_samples muestras"""
+        if n_samples > self.fft_size:
+            raise ValueError(f"Chirp de {n_samples} muestras excede fft_size={self.fft_size}")
+        self.n_samples = n_samples
+        self.window = np.hanning(n_samples).astype(np.float32)
+        self.buffer = np.zeros(self.fft_size, dtype=np.complex64)
+        # Vistas float32 intercaladas de la parte real e imaginaria
+        interleaved = self.buffer.view(np.float32)
+        self._real = interleaved[0:2 * n_samples:2]
+        self._imag = interleaved[1:2 * n_samples:2]
@@ -0,0 +1,110 @@
+# ==============================================================================
+# core/quality.py
+# ==============================================================================
+import numpy as np
+from typing import List, Tuple
+from core.data_models import ChannelData, QualityStats
+
+class DataQualityGate:
+    """
+    Control de calidad vectorizado de tramas I/Q antes del DSP
+    Detecta buffers rellenados con ceros (timeout del ADC), rachas en los rieles,
+    recorte/saturación y varianza anómala entre los chirps de la misma trama
+    Sin estado entre tramas: un blanco que entra o sale de la escena cambia
+    todos los chirps a la vez y no se considera una falla
+    """
+
+    ACTIONS = ("reject", "flag")
+
+    def __init__(self, adc_min: int = 0, adc_max: int = 4095, max_rail_run: int = 8,
+                 max_clip_ratio: float = 0.05, min_std: float = 1.0, std_ratio: float = 4.0,
+                 action: str = "reject"):
+        if action not in self.ACTIONS:
+            raise ValueError(f"Acción de calidad desconocida: {action}")
+        self.adc_min = adc_min
+        self.adc_max = adc_max
+        self.max_rail_run = max_rail_run
+        self.max_clip_ratio = max_clip_ratio
+        self.min_std = min_std
+        self.std_ratio = std_ratio
+        self.action = action
+
+    def keep(self, quality: QualityStats) -> bool:
+        """Indica si la trama debe pasar al DSP según la acción configurada"""
+        if quality.valid:
+            return True
+        # Una trama desalineada no se puede procesar ni siquiera para marcarla
+        return self.action == "flag" and "desalineada" not in quality.reasons
+
+    def check(self, channels: List[Tuple[ChannelData, ChannelData]]) -> QualityStats:
+        """
+        Evalúa todos los chirps de una trama en un solo bloque
+        channels: pares (I, Q) del canal de referencia y del arreglo
+        """
+        chirps = [samples for data_I, data_Q in channels
+                  for data in (data_I, data_Q)
+                  for samples in (data.up_samples, data.down_samples)]
+
+        # Chirps faltantes o de distinto largo: trama desalineada
+        lengths = {0 if samples is None else len(samples) for samples in chirps}
+        if len(lengths) != 1 or 0 in lengths:
+            return QualityStats(False, ["desalineada"], 0.0, 0.0, 0, np.zeros(len(chirps)))
+
+        block = np.stack(chirps)                                 # (n_chirps, n)
+        zero = block == 0
+        railed = (block <= self.adc_min) | (block >= self.adc_max)
+
+        zero_ratio = float(zero.mean())
+        clip_ratio = float(railed.mean())
+        max_rail_run = self._longest_run(railed)
+        std = block.std(axis=1)
+
+        reasons = []
+        if max_rail_run >= self.max_rail_run:
+            reasons.append("racha_en_riel")
+        if clip_ratio > self.max_clip_ratio:
+            reasons.append("saturada")
+        if np.any(std < self.min_std):
+            reasons.append("canal_plano")
+
+        # Varianza relativa dentro de la trama: cada chirp contra la mediana de la trama
+        reference = float(np.median(std))
+        if np.any(std > self.std_ratio * reference):
+            reasons.append("varianza_alta")
+        if np.any(std < reference / self.std_ratio) and "canal_plano" not in reasons:
+            reasons.append("varianza_baja")
+        # Pares del mismo canal (orden de chirps: I sub, I baj, Q sub, Q baj): I vs Q y subida vs bajada
+        if "canal_plano" not in reasons:
+            per_channel = std.reshape(-1, 2, 2)                  # (canal, I/Q, rampa)
+            if self._unbalanced(per_channel[:, 0, :], per_channel[:, 1, :]):
+                reasons.append("desbalance_iq")
+            if self._unbalanced(per_channel[:, :, 0], per_channel[:, :, 1]):
+                reasons.append("desbalance_rampas")
+
+        return QualityStats(
+            valid=not reasons,
+            reasons=reasons,
+            zero_ratio=zero_ratio,
+            clip_ratio=clip_ratio,
+            max_rail_run=max_rail_run,
+            std=std
+        )
+
+    def _unbalanced(self, a: np.ndarray, b: np.ndarray) -> bool:
+        """True si algún par de std difiere en más de std_ratio veces"""
+        with np.errstate(divide="ignore", invalid="ignore"):  # min_std = 0 admite canales en cero
+            ratio = a / b
+        return bool(np.any((ratio > self.std_ratio) | (ratio < 1.0 / self.std_ratio)))
+
+    @staticmethod
+    def _longest_run(mask: np.ndarray) -> int:
+        """Racha más larga de True en cualquier fila, sin bucles por muestra"""
+        if not mask.any():
+            return 0
+        # Una columna False entre filas evita que las rachas se unan
+        padded = np.zeros((mask.shape[0], mask.shape[1] + 1), dtype=np.int8)
+        padded[:, 1:] = mask
+        edges = np.diff(np.concatenate([padded.ravel(), [0]]))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        return int((ends - starts).max())
@@ -3,41 +3,95 @@
 # ==============================================================================
 import numpy as np
 from typing import Tuple
+from core.preprocessing import IQPreprocessor
 
 class SignalProcessor:
     """Procesamiento de señales de radar FMCW"""
     
-    def __init__(self, fs: float):
+    def __init__(self, fs: float, n_samples: int = 256, use_numba: bool = False):
         self.fs = fs
         self.fft_size = 1024 # Usado para agregar Zero Padding, ya que entran menos muestras
+        self.freqs = np.fft.fftshift(np.fft.fftfreq(self.fft_size, 1/self.fs))
+        self.preprocessor = IQPreprocessor(n_samples, self.fft_size, use_numba)
+        self._scipy_fft = None  # FFT complex64 en el lugar, disponible después de warm_up
     
-    def get_peak_freq_complex(self, signal_complex: np.ndarray) -> Tuple[float, np.ndarray, np.ndarray]:
+    def warm_up(self):
         """
-        Calcula la frecuencia pico de una señal compleja
+        Carga los aceleradores opcionales (scipy.fft, kernel Numba)
+        Costoso: llamar en un hilo aparte; hasta entonces se usa np.fft y NumPy
+        """
+        try:
+            from scipy import fft as scipy_fft
+            self._scipy_fft = scipy_fft
+        except ImportError:
+            pass
+        self.preprocessor.warm_up()
+    
+    def get_peak_freq_iq(self, i_samples: np.ndarray, q_samples: np.ndarray) -> Tuple[float, np.ndarray, np.ndarray]:
+        """
+        Calcula la frecuencia pico de la señal compleja I+jQ
+        DC, ventana e I+jQ se calculan en un buffer reutilizable (sin temporales)
         Returns: (frecuencia_pico, magnitud_espectro, vector_frecuencias)
         """
-        # Remover DC
-        signal_complex = signal_complex - np.mean(signal_complex)
+        padded = self.preprocessor.process(i_samples, q_samples)
         
-        # Ventana
-        window = np.hanning(len(signal_complex))
-        
-        # FFT completa
-        spectrum = np.fft.fft(signal_complex * window, n=self.fft_size)
-        spectrum = np.fft.fftshift(spectrum)
+        # FFT sobre el buffer ya rellenado con ceros
+        scipy_fft = self._scipy_fft
+        if scipy_fft is not None:
+            spectrum = scipy_fft.fft(padded, overwrite_x=True)
+        else:
+            spectrum = np.fft.fft(padded)
         
-        # Magnitud
-        magnitude = np.abs(spectrum)
+        return self.peak_freq_spectrum(spectrum)
+
+    def peak_freq_spectrum(self, spectrum: np.ndarray) -> Tuple[float, np.ndarray, np.ndarray]:
+        """
+        Frecuencia pico de un espectro complejo SIN fftshift (p. ej. una fila de range_spectra_iq)
+        Returns: (frecuencia_pico, magnitud_espectro con fftshift, vector_frecuencias)
+        """
+        # Magnitud con fftshift escrita directamente en el arreglo de salida
+        half = self.fft_size // 2
+        magnitude = np.empty(self.fft_size, dtype=np.float32)
+        np.abs(spectrum[:self.fft_size - half], out=magnitude[half:])
+        np.abs(spectrum[self.fft_size - half:], out=magnitude[:half])
         
-        # Buscar pico
         peak_bin = np.argmax(magnitude)
+        return np.abs(self.freqs[peak_bin]), magnitude, self.freqs
+
+    def find_peaks(self, magnitude: np.ndarray, max_peaks: int = 4,
+                   threshold: float = 0.25) -> np.ndarray:
+        """
+        Bins de los máximos locales por encima de threshold * máximo
+        Returns: bins ordenados de mayor a menor magnitud (a lo sumo max_peaks)
+        """
+        inner = magnitude[1:-1]
+        is_peak = (inner > magnitude[:-2]) & (inner >= magnitude[2:]) & \
+                  (inner >= threshold * magnitude.max())
+        bins = np.flatnonzero(is_peak) + 1
+        if len(bins) == 0:
+            return np.array([np.argmax(magnitude)])
+        return bins[np.argsort(magnitude[bins])[::-1][:max_peaks]]
+
+    def range_spectra_iq(self, channels, out: np.ndarray) -> np.ndarray:
+        """
+        Espectros complejos de ambas rampas de todos los canales, sin temporales
+        channels: pares (I, Q) por canal; out: complex64 reutilizable (K, 2, fft_size)
+        Cada fila se preprocesa con IQPreprocessor y luego una sola FFT batch
+        Returns: espectros SIN fftshift (ver unshifted_bins), forma (K, 2, fft_size)
+        """
+        for k, (data_I, data_Q) in enumerate(channels):
+            self.preprocessor.process(data_I.up_samples, data_Q.up_samples, out=out[k, 0])
+            self.preprocessor.process(data_I.down_samples, data_Q.down_samples, out=out[k, 1])
         
-        # Calcular frecuencia
-        freqs = np.fft.fftshift(np.fft.fftfreq(self.fft_size, 1/self.fs))
-        freq = freqs[peak_bin]
-        
-        return np.abs(freq), magnitude, freqs
-    
+        scipy_fft = self._scipy_fft
+        if scipy_fft is not None:
+            return scipy_fft.fft(out, axis=-1, overwrite_x=True)
+        return np.fft.fft(out, axis=-1)
+
+    def unshifted_bins(self, bins: np.ndarray) -> np.ndarray:
+        """Convierte bins del espectro con fftshift a índices del espectro sin shift"""
+        return (np.asarray(bins) - self.fft_size // 2) % self.fft_size
+
     @staticmethod
     def calculate_distance(f_up: float, f_down: float, c: float, K: float) -> float:
         """Calcula distancia: R = (f_up + f_down) * c / (4*K)"""
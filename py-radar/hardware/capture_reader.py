@@ -0,0 +1,128 @@
+# ==============================================================================
+# hardware/capture_reader.py
+# ==============================================================================
+import os
+import numpy as np
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple, Union
+from hardware.packet_parser import PacketParser
+
+CAPTURE_KEYS = ("I_up", "I_down", "Q_up", "Q_down")
+
+@dataclass
+class RawCapture:
+    """
+    Captura cruda indexada: offsets (en bytes) del payload de cada rampa, sin decodificar
+    Cada bloque se decodifica en el proceso que lo analiza (ver load)
+    """
+    path_I: str
+    path_Q: str
+    offsets_I: np.ndarray  # (n_frames, 2): payload de subida y de bajada
+    offsets_Q: np.ndarray
+    n_samples: int
+    samples_per_ramp: int
+
+    def __len__(self) -> int:
+        return len(self.offsets_I)
+
+    def slice(self, start: int, stop: int) -> "RawCapture":
+        """Bloque de tramas [start, stop) (solo copia offsets)"""
+        return RawCapture(self.path_I, self.path_Q, self.offsets_I[start:stop],
+                          self.offsets_Q[start:stop], self.n_samples, self.samples_per_ramp)
+
+    def load(self) -> Dict[str, np.ndarray]:
+        """Decodifica las tramas del bloque como arreglos (n_frames, samples_per_ramp)"""
+        I_up, I_down = read_raw_frames(self.path_I, self.offsets_I, self.n_samples, self.samples_per_ramp)
+        Q_up, Q_down = read_raw_frames(self.path_Q, self.offsets_Q, self.n_samples, self.samples_per_ramp)
+        return {"I_up": I_up, "I_down": I_down, "Q_up": Q_up, "Q_down": Q_down}
+
+def index_raw_channel(path: str, n_samples: int) -> np.ndarray:
+    """
+    Indexa un volcado crudo de un puerto serial (protocolo 0xAA55 ... 0x55AA)
+    Recorre los paquetes como PacketParser y arma las rampas igual que SerialChannelReader,
+    pero solo guarda dónde empieza el payload de cada una
+    Returns: offsets de forma (n_frames, 2) con el payload de subida y de bajada
+    """
+    packet_size = 2 * n_samples + 5  # header(2) + tipo(1) + datos + footer(2)
+    data = np.memmap(path, dtype=np.uint8, mode="r") if os.path.getsize(path) else np.zeros(0, np.uint8)
+    headers = np.flatnonzero((data[:-1] == PacketParser.HEADER_START[0]) &
+                             (data[1:] == PacketParser.HEADER_START[1]))
+
+    frames = []
+    up = down = None
+    pos = 0
+    k = np.searchsorted(headers, pos)
+    while k < len(headers):
+        h = int(headers[k])
+        if h + packet_size > len(data):
+            break  # Paquete truncado al final del archivo
+        pos = h + packet_size  # El parser consume el paquete completo, sea válido o no
+        if data[pos - 2] == PacketParser.FOOTER_END[0] and data[pos - 1] == PacketParser.FOOTER_END[1]:
+            pkt_type = data[h + 2]
+            if pkt_type == 1:  # SUBIDA
+                up = h + 3
+            elif pkt_type == 2:  # BAJADA
+                down = h + 3
+
+            # Trama completa cuando tengamos ambas rampas
+            if up is not None and down is not None:
+                frames.append((up, down))
+                up = down = None
+        k = np.searchsorted(headers, pos, side="left")
+
+    return np.array(frames, dtype=np.int64).reshape(-1, 2)
+
+def read_raw_frames(path: str, offsets: np.ndarray, n_samples: int,
+                    samples_per_ramp: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Decodifica las rampas indicadas por offsets (ver index_raw_channel)
+    Returns: (up, down) float32 de forma (n_frames, samples_per_ramp)
+    """
+    if len(offsets) == 0:
+        empty = np.empty((0, samples_per_ramp), dtype=np.float32)
+        return empty, empty
+    samples = np.memmap(path, dtype=np.uint8, mode="r")
+    # Índices de bytes de cada rampa: (n_frames, 2, 2 * n_samples)
+    idx = offsets[:, :, None] + np.arange(2 * n_samples)[None, None, :]
+    payload = np.ascontiguousarray(samples[idx]).view("<i2").astype(np.float32)
+    up = payload[:, 0, :samples_per_ramp]
+    down = payload[:, 1, n_samples - samples_per_ramp:]
+    return np.ascontiguousarray(up), np.ascontiguousarray(down)
+
+def read_raw_channel(path: str, n_samples: int, samples_per_ramp: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Lee un volcado crudo completo de un puerto serial
+    Returns: (up, down) de forma (n_frames, samples_per_ramp)
+    """
+    return read_raw_frames(path, index_raw_channel(path, n_samples), n_samples, samples_per_ramp)
+
+def capture_frames(capture: Union[Dict[str, np.ndarray], RawCapture]) -> int:
+    """Número de tramas de una captura cargada con load_capture"""
+    return len(capture) if isinstance(capture, RawCapture) else len(capture["I_up"])
+
+def load_capture(path_I: str, path_Q: Optional[str], n_samples: int,
+                 samples_per_ramp: int) -> Union[Dict[str, np.ndarray], RawCapture]:
+    """
+    Carga una captura
+    - path_I .npz con I_up, I_down, Q_up, Q_down (path_Q se ignora): arreglos (n_frames, samples_per_ramp)
+    - path_I / path_Q volcados crudos de los puertos I y Q: RawCapture (solo el índice;
+      la decodificación se hace por bloques en los procesos del pool)
+    """
+    if path_I.endswith(".npz"):
+        with np.load(path_I) as data:
+            missing = [key for key in CAPTURE_KEYS if key not in data]
+            if missing:
+                raise ValueError(f"Captura {path_I} sin los arreglos: {', '.join(missing)}")
+            capture = {key: np.asarray(data[key], dtype=np.float32) for key in CAPTURE_KEYS}
+
+        # Emparejar tramas I/Q por orden de llegada, como RadarProcessor
+        n_frames = min(len(capture[key]) for key in CAPTURE_KEYS)
+        return {key: capture[key][:n_frames] for key in CAPTURE_KEYS}
+
+    if path_Q is None:
+        raise ValueError("Una captura cruda necesita los archivos de los canales I y Q")
+    offsets_I = index_raw_channel(path_I, n_samples)
+    offsets_Q = index_raw_channel(path_Q, n_samples)
+    n_frames = min(len(offsets_I), len(offsets_Q))
+    return RawCapture(path_I, path_Q, offsets_I[:n_frames], offsets_Q[:n_frames],
+                      n_samples, samples_per_ramp)
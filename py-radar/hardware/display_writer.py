@@ -4,16 +4,18 @@
 import serial
 import threading
 import queue
-import time
 from core.data_models import RadarResults
 
 class DisplayWriter:
     """Envía datos del radar a un display OLED via Arduino"""
     
-    def __init__(self, port: str, baudrate: int, input_queue: queue.Queue):
+    def __init__(self, port: str, baudrate: int, input_queue: queue.Queue,
+                 reset_wait: float = 2.0):
         self.port = port
         self.baudrate = baudrate
         self.input_queue = input_queue
+        self.reset_wait = reset_wait
+        self._stop_event = threading.Event()
         self._running = False
         self._thread = None
         self._serial = None
@@ -21,6 +23,7 @@ class DisplayWriter:
     def start(self):
         """Inicia el hilo de escritura"""
         self._running = True
+        self._stop_event.clear()
         self._thread = threading.Thread(target=self._write_loop, daemon=True)
         self._thread.start()
         print(f"[DISPLAY] Escritor iniciado en {self.port}")
@@ -28,6 +31,7 @@ class DisplayWriter:
     def stop(self):
         """Detiene el hilo de escritura"""
         self._running = False
+        self._stop_event.set()
         if self._thread:
             self._thread.join(timeout=2.0)
         if self._serial and self._serial.is_open:
@@ -39,7 +43,11 @@ class DisplayWriter:
         try:
             # Abrir puerto serial
             self._serial = serial.Serial(self.port, self.baudrate, timeout=1.0)
-            time.sleep(2)  # Esperar a que Arduino reinicie después de conexión
+            # Esperar a que Arduino reinicie después de conexión (interrumpible por stop)
+            if self._stop_event.wait(self.reset_wait):
+                return
+            # Descartar resultados acumulados durante la espera, conservar el último
+            self._drain_stale()
             print(f"[DISPLAY] Conectado a Arduino en {self.port}")
             
             while self._running:
@@ -69,6 +77,20 @@ class DisplayWriter:
             if self._serial and self._serial.is_open:
                 self._serial.close()
     
+    def _drain_stale(self):
+        """Deja en la cola solo el resultado más reciente"""
+        latest = None
+        while True:
+            try:
+                latest = self.input_queue.get_nowait()
+            except queue.Empty:
+                break
+        if latest is not None:
+            try:
+                self.input_queue.put(latest, block=False)
+            except queue.Full:
+                pass
+    
     def _format_message(self, results: RadarResults) -> str:
         """
         Formatea los datos para enviar al Arduino
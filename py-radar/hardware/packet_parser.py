@@ -1,7 +1,6 @@
 # ==============================================================================
 # hardware/packet_parser.py
 # ==============================================================================
-import serial
 import numpy as np
 from struct import unpack
 from typing import Optional, Tuple
@@ -15,16 +14,25 @@ class PacketParser:
     def __init__(self, n_samples: int):
         self.n_samples = n_samples
     
-    def read_packet(self, ser: serial.Serial) -> Tuple[Optional[int], Optional[np.ndarray]]:
-        """Lee un paquete del puerto serial"""
-        # Buscar header
+    def read_packet(self, ser) -> Tuple[Optional[int], Optional[np.ndarray]]:
+        """
+        Lee un paquete del puerto serial
+        ser: cualquier objeto con read(n) (serial.Serial o archivo binario de captura)
+        """
+        # Buscar header (timeout o fin de archivo => sin paquete)
         while True:
-            if ser.read(1) == bytes([self.HEADER_START[0]]) and \
+            byte = ser.read(1)
+            if not byte:
+                return None, None
+            if byte == bytes([self.HEADER_START[0]]) and \
                ser.read(1) == bytes([self.HEADER_START[1]]):
                 break
         
         # Leer tipo de paquete
-        pkt_type = ser.read(1)[0]
+        pkt_type = ser.read(1)
+        if len(pkt_type) != 1:
+            return None, None
+        pkt_type = pkt_type[0]
         
         # Leer datos
         data = ser.read(self.n_samples * 2)
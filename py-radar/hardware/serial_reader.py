@@ -4,6 +4,7 @@
 import serial
 import threading
 import queue
+import time
 from typing import Callable
 from core.data_models import ChannelData
 from hardware.packet_parser import PacketParser
@@ -49,6 +50,8 @@ class SerialChannelReader:
                 
                 if pkt_type == 1:  # SUBIDA
                     channel_data.up_samples = samples[:self.sampler_per_ramp]
+                    # Marca de tiempo de la trama para alinear canales en el procesador
+                    channel_data.timestamp = time.monotonic()
                     print(f"[{self.channel_name}] Rampa SUBIDA recibida")
                 
                 elif pkt_type == 2:  # BAJADA
@@ -0,0 +1,99 @@
+# ==============================================================================
+# hardware/synthetic_source.py
+# ==============================================================================
+import threading
+import queue
+import time
+import numpy as np
+from typing import List, Tuple
+from core.data_models import ChannelData
+from config.radar_config import RadarConfig
+
+class SyntheticArraySource:
+    """Genera tramas I/Q simuladas para todos los canales del arreglo (sin hardware)"""
+
+    ADC_OFFSET = 2048.0      # Nivel medio del ADC de 12 bits
+    ADC_AMPLITUDE = 1000.0
+
+    def __init__(self, config: RadarConfig, channel_queues: List[Tuple[queue.Queue, queue.Queue]],
+                 seed: int = None):
+        self.config = config
+        self.channel_queues = channel_queues
+        self._rng = np.random.default_rng(seed)
+        self._running = False
+        self._thread = None
+
+    def start(self):
+        """Inicia el hilo de generación"""
+        self._running = True
+        self._thread = threading.Thread(target=self._generate_loop, daemon=True)
+        self._thread.start()
+        print(f"[SIM] Fuente sintética iniciada ({len(self.channel_queues)} canales)")
+
+    def stop(self):
+        """Detiene el hilo de generación"""
+        self._running = False
+        if self._thread:
+            self._thread.join(timeout=2.0)
+
+    def _generate_loop(self):
+        """Loop principal de generación"""
+        while self._running:
+            for (q_I, q_Q), (data_I, data_Q) in zip(self.channel_queues, self.generate_frame()):
+                self._send_data(q_I, data_I)
+                self._send_data(q_Q, data_Q)
+            time.sleep(self.config.synthetic_period)
+
+    def generate_frame(self) -> List[Tuple[ChannelData, ChannelData]]:
+        """Genera una trama (subida + bajada) para cada canal del arreglo"""
+        cfg = self.config
+        n = cfg.samples_per_ramp
+        n_rx = len(self.channel_queues)
+        t = np.arange(n) / cfg.Fs
+        k = np.arange(n_rx)[:, None]
+        slope = cfg.K
+        timestamp = time.monotonic()
+
+        up = np.zeros((n_rx, n), dtype=complex)
+        down = np.zeros((n_rx, n), dtype=complex)
+        for distance, velocity, azimuth in cfg.synthetic_targets:
+            # Inverso de calculate_distance / calculate_velocity
+            f_sum = distance * 4 * 3 * slope / cfg.c
+            f_diff = velocity * 4 * cfg.fc / cfg.c
+            f_up = (f_sum + f_diff) / 2
+            f_down = (f_sum - f_diff) / 2
+            # Desfase entre elementos del arreglo
+            phase = 2 * np.pi * cfg.element_spacing * np.sin(np.deg2rad(azimuth)) * k
+            up += np.exp(1j * (2 * np.pi * f_up * t[None, :] + phase))
+            down += np.exp(1j * (2 * np.pi * f_down * t[None, :] + phase))
+
+        frame = []
+        for ch in range(n_rx):
+            suffix = "" if ch == 0 else str(ch)
+            iq = []
+            for name, part in (("I", np.real), ("Q", np.imag)):
+                iq.append(ChannelData(
+                    channel_id=f"{name}{suffix}",
+                    up_samples=self._to_adc(part(up[ch])),
+                    down_samples=self._to_adc(part(down[ch])),
+                    timestamp=timestamp
+                ))
+            frame.append(tuple(iq))
+        return frame
+
+    def _to_adc(self, signal: np.ndarray) -> np.ndarray:
+        """Escala al rango del ADC, agrega ruido y cuantiza como el firmware"""
+        noise = self._rng.normal(0.0, self.config.synthetic_noise, signal.shape)
+        samples = self.ADC_OFFSET + self.ADC_AMPLITUDE * signal + noise
+        return np.clip(np.round(samples), 0, 4095).astype(np.float32)
+
+    def _send_data(self, output_queue: queue.Queue, data: ChannelData):
+        """Envía datos a la cola de procesamiento (descarta el más antiguo si está llena)"""
+        try:
+            output_queue.put(data, block=False)
+        except queue.Full:
+            try:
+                output_queue.get_nowait()
+                output_queue.put(data, block=False)
+            except:
+                pass
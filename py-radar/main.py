@@ -3,73 +3,163 @@
 # ==============================================================================
 # main.py
 # ==============================================================================
+import time
+T_START = time.perf_counter()  # Referencia para medir tiempo hasta el primer resultado
+
+import argparse
 import queue
 from config.radar_config import RadarConfig
-from hardware.serial_reader import SerialChannelReader
-from hardware.display_writer import DisplayWriter
 from processing.radar_processor import RadarProcessor
-from visualization.plotter import RadarPlotter
 
-def main():
+def parse_args(argv=None) -> argparse.Namespace:
+    """Argumentos de línea de comandos (sobrescriben RadarConfig)"""
+    parser = argparse.ArgumentParser(description="Sistema FMCW Radar I/Q")
+    parser.add_argument("--headless", action="store_true",
+                        help="Sin visualización (no importa matplotlib)")
+    parser.add_argument("--no-display", action="store_true",
+                        help="Deshabilita la salida al OLED")
+    parser.add_argument("--synthetic", action="store_true",
+                        help="Usa datos simulados en lugar de los puertos seriales")
+    parser.add_argument("--port-i", help="Puerto del canal I")
+    parser.add_argument("--port-q", help="Puerto del canal Q")
+    parser.add_argument("--port-display", help="Puerto del Arduino/OLED")
+    parser.add_argument("--aoa", choices=("bartlett", "capon"),
+                        help="Método de estimación del ángulo de llegada")
+    parser.add_argument("--numba", action="store_true",
+                        help="Usa el kernel Numba de preprocesado (se compila en segundo plano)")
+    parser.add_argument("--max-frames", type=int, default=0,
+                        help="Termina tras N resultados (solo headless, 0 = sin límite)")
+    return parser.parse_args(argv)
+
+def build_config(args: argparse.Namespace) -> RadarConfig:
+    """Crea la configuración aplicando los argumentos"""
+    config = RadarConfig()
+    if args.headless:
+        config.headless = True
+    if args.no_display:
+        config.enable_display = False
+    if args.synthetic:
+        config.use_synthetic = True
+    if args.port_i:
+        config.port_I = args.port_i
+    if args.port_q:
+        config.port_Q = args.port_q
+    if args.port_display:
+        config.port_display = args.port_display
+    if args.numba:
+        config.use_numba = True
+    if args.aoa:
+        config.aoa_method = args.aoa
+    return config
+
+def create_sources(config: RadarConfig, queue_I: queue.Queue, queue_Q: queue.Queue, array_queues):
+    """Crea las fuentes de datos (importa solo el módulo que se usa)"""
+    if config.use_synthetic:
+        from hardware.synthetic_source import SyntheticArraySource
+        return [SyntheticArraySource(config, [(queue_I, queue_Q)] + array_queues)]
+
+    from hardware.serial_reader import SerialChannelReader
+    channels = [(config.port_I, config.port_Q, "", queue_I, queue_Q)]
+    channels += [
+        (port_I, port_Q, str(k), q_I, q_Q)
+        for k, ((port_I, port_Q), (q_I, q_Q)) in enumerate(zip(config.array_ports, array_queues), start=1)
+    ]
+    sources = []
+    for port_I, port_Q, suffix, q_I, q_Q in channels:
+        sources.append(SerialChannelReader(
+            port_I, f"I{suffix}", config.baudrate,
+            config.timeout, config.N_SAMPLES, q_I,
+            config.samples_per_ramp
+        ))
+        sources.append(SerialChannelReader(
+            port_Q, f"Q{suffix}", config.baudrate,
+            config.timeout, config.N_SAMPLES, q_Q,
+            config.samples_per_ramp
+        ))
+    return sources
+
+def run_headless(queue_results: queue.Queue, max_frames: int):
+    """Consume resultados sin visualización (blocking)"""
+    frames = 0
+    while max_frames <= 0 or frames < max_frames:
+        try:
+            queue_results.get(timeout=0.5)
+            frames += 1
+        except queue.Empty:
+            continue
+    print(f"[MAIN] {frames} resultados procesados")
+
+def main(argv=None):
+    args = parse_args(argv)
+
     print("="*70)
     print("           SISTEMA FMCW RADAR I/Q ")
     print("="*70)
-    
+
     # Configuración
-    config = RadarConfig()
-    
+    config = build_config(args)
+
     # Colas de comunicación
     queue_I = queue.Queue(maxsize=config.queue_size)
     queue_Q = queue.Queue(maxsize=config.queue_size)
     queue_results = queue.Queue(maxsize=config.queue_size)
-    queue_display = queue.Queue(maxsize=config.queue_size)
-    
+    queue_display = queue.Queue(maxsize=config.queue_size) if config.enable_display else None
+    # Colas de los elementos adicionales del arreglo (pares I/Q)
+    array_queues = [
+        (queue.Queue(maxsize=config.queue_size), queue.Queue(maxsize=config.queue_size))
+        for _ in config.array_ports
+    ]
+
     # Crear componentes
-    reader_I = SerialChannelReader(
-        config.port_I, "I", config.baudrate, 
-        config.timeout, config.N_SAMPLES, queue_I,
-        config.samples_per_ramp
-    )
-    reader_Q = SerialChannelReader(
-        config.port_Q, "Q", config.baudrate, 
-        config.timeout, config.N_SAMPLES, queue_Q,
-        config.samples_per_ramp
-    )
-    processor = RadarProcessor(config, queue_I, queue_Q, queue_results, queue_display)
-    plotter = RadarPlotter(config, queue_results)
-
-    # Crear display writer (opcional)  # ← NUEVO BLOQUE
+    sources = create_sources(config, queue_I, queue_Q, array_queues)
+    processor = RadarProcessor(config, queue_I, queue_Q, queue_results, queue_display,
+                               array_queues, t_start=T_START)
+
+    # Crear display writer (opcional)
     display_writer = None
     if config.enable_display:
+        from hardware.display_writer import DisplayWriter
         display_writer = DisplayWriter(
-            config.port_display, 
-            config.baudrate_display, 
-            queue_display
+            config.port_display,
+            config.baudrate_display,
+            queue_display,
+            config.display_reset_wait
         )
-    
-    # Iniciar sistema
-    reader_I.start()
-    reader_Q.start()
+
+    # Iniciar sistema: cada componente abre su puerto en su propio hilo,
+    # así la apertura y la espera de reinicio del Arduino ocurren en paralelo
+    for source in sources:
+        source.start()
     processor.start()
 
-    if display_writer: 
+    if display_writer:
         display_writer.start()
-    
+
     print("[MAIN] Sistema iniciado")
-    if config.enable_display:  
+    if config.enable_display:
         print(f"[MAIN] Display OLED habilitado en {config.port_display}")
-    
-    # Visualización (blocking)
+    if config.n_rx > 1:
+        print(f"[MAIN] Arreglo de {config.n_rx} canales, AoA: {config.aoa_method}")
+
+    # Visualización o modo headless (blocking)
     try:
-        plotter.start()
+        if config.headless:
+            run_headless(queue_results, args.max_frames)
+        else:
+            # matplotlib se importa después de arrancar la adquisición
+            from visualization.plotter import RadarPlotter
+            RadarPlotter(config, queue_results).start()
     except KeyboardInterrupt:
-        print("\n[MAIN] Deteniendo sistema...")
-        reader_I.stop()
-        reader_Q.stop()
-        processor.stop()
-        if display_writer:  
-            display_writer.stop()
-        print("[MAIN] Sistema detenido")
+        pass
+
+    print("\n[MAIN] Deteniendo sistema...")
+    for source in sources:
+        source.stop()
+    processor.stop()
+    if display_writer:
+        display_writer.stop()
+    print("[MAIN] Sistema detenido")
+    return 0
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    raise SystemExit(main())
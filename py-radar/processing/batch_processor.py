@@ -0,0 +1,127 @@
+# ==============================================================================
+# processing/batch_processor.py
+# ==============================================================================
+import os
+import time
+import numpy as np
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+from core.data_models import ChannelData
+from core.signal_processing import SignalProcessor
+from core.quality import DataQualityGate
+from config.radar_config import RadarConfig
+from hardware.capture_reader import RawCapture, capture_frames
+
+Capture = Union[Dict[str, np.ndarray], RawCapture]
+
+# Fila por trama: (trama, f_up, f_down, distancia, velocidad, dirección, válida, motivos)
+FrameRow = Tuple[int, float, float, float, float, str, bool, str]
+RESULT_COLUMNS = ("frame", "f_up", "f_down", "distance", "velocity", "direction", "valid", "reasons")
+
+class ChunkWorker:
+    """Aplica la matemática de SignalProcessor a un bloque de tramas"""
+
+    def __init__(self, config: RadarConfig):
+        self.config = config
+        self.signal_processor = SignalProcessor(config.Fs, config.samples_per_ramp, config.use_numba)
+        self.signal_processor.warm_up()  # En lote conviene compilar antes del primer bloque
+        self.quality_gate = DataQualityGate(
+            config.adc_min, config.adc_max, config.quality_max_rail_run,
+            config.quality_max_clip_ratio, config.quality_min_std, config.quality_std_ratio,
+            config.quality_action
+        )
+        self.K = config.K  # Se calcula una sola vez por proceso
+
+    def process(self, start: int, chunk: Capture) -> List[FrameRow]:
+        """
+        Procesa las tramas del bloque; start es el índice de la primera trama
+        Un bloque crudo (RawCapture) se decodifica aquí, en el proceso del pool
+        """
+        if isinstance(chunk, RawCapture):
+            chunk = chunk.load()
+        cfg = self.config
+        sp = self.signal_processor
+        rows = []
+        for k in range(len(chunk["I_up"])):
+            data_I = ChannelData("I", chunk["I_up"][k], chunk["I_down"][k])
+            data_Q = ChannelData("Q", chunk["Q_up"][k], chunk["Q_down"][k])
+            quality = self.quality_gate.check([(data_I, data_Q)])
+            reasons = ";".join(quality.reasons)
+
+            if not self.quality_gate.keep(quality):
+                rows.append((start + k, np.nan, np.nan, np.nan, np.nan, "", False, reasons))
+                continue
+
+            f_up, _, _ = sp.get_peak_freq_iq(data_I.up_samples, data_Q.up_samples)
+            f_down, _, _ = sp.get_peak_freq_iq(data_I.down_samples, data_Q.down_samples)
+            rows.append((
+                start + k, float(f_up), float(f_down),
+                float(sp.calculate_distance(f_up, f_down, cfg.c, self.K)),
+                float(sp.calculate_velocity(f_up, f_down, cfg.c, cfg.fc)),
+                sp.determine_direction(f_up, f_down),
+                quality.valid, reasons
+            ))
+        return rows
+
+# Estado por proceso del pool (se crea una vez en el inicializador)
+_worker: Optional[ChunkWorker] = None
+
+def _init_worker(config: RadarConfig):
+    global _worker
+    _worker = ChunkWorker(config)
+
+def _process_chunk(args: Tuple[int, Capture]) -> List[FrameRow]:
+    return _worker.process(*args)
+
+class BatchProcessor:
+    """Procesa capturas completas fuera de línea repartiendo bloques en un pool de procesos"""
+
+    def __init__(self, config: RadarConfig, workers: Optional[int] = None, chunk_size: int = 256,
+                 max_pending: Optional[int] = None):
+        self.config = config
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        # Bloques enviados al pool sin consumir (acota la memoria del proceso principal)
+        self.max_pending = max_pending or 2 * self.workers
+
+    def _chunks(self, capture: Capture) -> Iterator[Tuple[int, Capture]]:
+        """Divide la captura en bloques contiguos de chunk_size tramas"""
+        for start in range(0, capture_frames(capture), self.chunk_size):
+            stop = start + self.chunk_size
+            if isinstance(capture, RawCapture):
+                yield start, capture.slice(start, stop)  # Solo offsets: se decodifica en el pool
+            else:
+                yield start, {key: arr[start:stop] for key, arr in capture.items()}
+
+    def run(self, capture: Capture, on_rows: Callable[[List[FrameRow]], None]) -> Tuple[int, float]:
+        """
+        Procesa la captura y entrega las filas en orden de trama a on_rows
+        Returns: (tramas procesadas, segundos de procesamiento)
+        """
+        n_frames = 0
+        t0 = time.perf_counter()
+
+        if self.workers == 1:
+            worker = ChunkWorker(self.config)
+            for chunk in self._chunks(capture):
+                rows = worker.process(*chunk)
+                on_rows(rows)
+                n_frames += len(rows)
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                     initargs=(self.config,)) as pool:
+                # Ventana de a lo sumo max_pending bloques; se consumen en orden de trama
+                pending = deque()
+                for chunk in self._chunks(capture):
+                    if len(pending) >= self.max_pending:
+                        rows = pending.popleft().result()
+                        on_rows(rows)
+                        n_frames += len(rows)
+                    pending.append(pool.submit(_process_chunk, chunk))
+                while pending:
+                    rows = pending.popleft().result()
+                    on_rows(rows)
+                    n_frames += len(rows)
+
+        return n_frames, time.perf_counter() - t0
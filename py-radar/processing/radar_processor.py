@@ -3,9 +3,14 @@
 # ==============================================================================
 import threading
 import queue
+import time
+from collections import deque
 import numpy as np
-from core.data_models import ChannelData, RadarResults
+from typing import List, Optional, Tuple
+from core.data_models import ChannelData, QualityStats, RadarResults, RadarTarget
 from core.signal_processing import SignalProcessor
+from core.quality import DataQualityGate
+from core.beamforming import ArrayBeamformer
 from config.radar_config import RadarConfig
 
 class RadarProcessor:
@@ -13,13 +18,43 @@ class RadarProcessor:
     
     def __init__(self, config: RadarConfig, queue_I: queue.Queue, 
                  queue_Q: queue.Queue, queue_results: queue.Queue,
-                 queue_display: queue.Queue):
+                 queue_display: queue.Queue,
+                 array_queues: Optional[List[Tuple[queue.Queue, queue.Queue]]] = None,
+                 t_start: Optional[float] = None):
         self.config = config
         self.queue_I = queue_I
         self.queue_Q = queue_Q
         self.queue_results = queue_results
         self.queue_display = queue_display
-        self.signal_processor = SignalProcessor(config.Fs)
+        # Canal de referencia primero, luego los elementos adicionales del arreglo
+        self.channel_queues = [(queue_I, queue_Q)] + list(array_queues or [])
+        self.signal_processor = SignalProcessor(config.Fs, config.samples_per_ramp, config.use_numba)
+        self.beamformer = None
+        self._array_buffer = None
+        if len(self.channel_queues) > 1:
+            self._array_buffer = np.zeros(
+                (len(self.channel_queues), 2, self.signal_processor.fft_size), dtype=np.complex64
+            )
+            self.beamformer = ArrayBeamformer(
+                len(self.channel_queues), config.element_spacing,
+                config.aoa_fov_deg, config.aoa_n_angles, config.aoa_method,
+                config.capon_loading, config.capon_neighbors
+            )
+        self.quality_gate = DataQualityGate(
+            config.adc_min, config.adc_max, config.quality_max_rail_run,
+            config.quality_max_clip_ratio, config.quality_min_std, config.quality_std_ratio,
+            config.quality_action
+        )
+        self.frames_checked = 0
+        self.frames_flagged = 0
+        self.frames_rejected = 0
+        # Tramas pendientes por cola (I0, Q0, I1, Q1, ...) para alinear por timestamp
+        self._streams = [channel_queue for channel in self.channel_queues for channel_queue in channel]
+        self._buffers = [deque(maxlen=config.queue_size) for _ in self._streams]
+        self.frames_unaligned = 0
+        # Medición de tiempo hasta el primer resultado
+        self.t_start = t_start if t_start is not None else time.perf_counter()
+        self.time_to_first_result = None
         self._running = False
         self._thread = None
     
@@ -28,6 +63,8 @@ class RadarProcessor:
         self._running = True
         self._thread = threading.Thread(target=self._process_loop, daemon=True)
         self._thread.start()
+        # Importación/compilación de aceleradores sin bloquear las primeras tramas
+        threading.Thread(target=self.signal_processor.warm_up, daemon=True).start()
         print("[PROC] Procesador iniciado")
     
     def stop(self):
@@ -38,41 +75,121 @@ class RadarProcessor:
     
     def _process_loop(self):
         """Loop principal de procesamiento"""
-        data_I = None
-        data_Q = None
-        
         while self._running:
-            # Obtener datos de ambos canales
+            # Una sola espera bloqueante, en la cola a la que le falta la trama que completa
+            # la alineación (la referencia si no hay nada pendiente); el resto se drena sin bloquear
+            waiting = self._missing_stream()
             try:
-                data_I = self.queue_I.get(timeout=0.1)
-                print("[PROC] Datos I recibidos")
+                self._buffer_data(waiting, self._streams[waiting].get(timeout=0.1))
             except queue.Empty:
                 pass
+            for k, stream in enumerate(self._streams):
+                while True:
+                    try:
+                        self._buffer_data(k, stream.get_nowait())
+                    except queue.Empty:
+                        break
             
-            try:
-                data_Q = self.queue_Q.get(timeout=0.1)
-                print("[PROC] Datos Q recibidos")
-            except queue.Empty:
-                pass
-            
-            # Procesar cuando tengamos ambos
-            if data_I is not None and data_Q is not None:
-                results = self._process_iq_data(data_I, data_Q)
-                self._publish_results(results)
-                data_I = None
-                data_Q = None
+            # Procesar cada trama completa y alineada
+            channels = self._align_frames()
+            while channels is not None:
+                (data_I, data_Q), array_data = channels[0], channels[1:]
+                quality = self._check_quality(channels)
+                if quality is not None:
+                    results = self._process_iq_data(data_I, data_Q, array_data, quality)
+                    self._publish_results(results)
+                channels = self._align_frames()
+    
+    def _buffer_data(self, k: int, data: ChannelData):
+        """Guarda una trama recibida en el buffer de su cola"""
+        self._buffers[k].append(data)
+        print(f"[PROC] Datos {data.channel_id} recibidos")
     
-    def _process_iq_data(self, data_I: ChannelData, data_Q: ChannelData) -> RadarResults:
+    def _missing_stream(self) -> int:
+        """Índice de la primera cola sin tramas pendientes (0 = referencia)"""
+        for k, buffer in enumerate(self._buffers):
+            if not buffer:
+                return k
+        return 0
+    
+    def _align_frames(self) -> Optional[List[List[ChannelData]]]:
+        """
+        Toma una trama de cada cola con timestamps dentro de max_channel_skew de la referencia
+        Descarta las tramas sin pareja en algún canal (la fase entre canales no sería válida)
+        Returns: pares [I, Q] por canal, o None si todavía falta algún canal
+        """
+        skew = self.config.max_channel_skew
+        reference = self._buffers[0]
+        while reference:
+            ref_time = reference[0].timestamp
+            matched = True
+            for buffer in self._buffers[1:]:
+                while buffer and buffer[0].timestamp < ref_time - skew:
+                    buffer.popleft()
+                    self._drop_unaligned()
+                if not buffer:
+                    return None
+                if buffer[0].timestamp > ref_time + skew:
+                    matched = False
+            if matched:
+                frames = [buffer.popleft() for buffer in self._buffers]
+                return [frames[k:k + 2] for k in range(0, len(frames), 2)]
+            # La referencia no tiene pareja: los demás canales ya van por una trama posterior
+            reference.popleft()
+            self._drop_unaligned()
+        return None
+    
+    def _drop_unaligned(self):
+        """Cuenta una trama descartada por desalineación entre canales"""
+        self.frames_unaligned += 1
+        print(f"[PROC] WARNING: Trama desalineada descartada ({self.frames_unaligned})")
+    
+    def _check_quality(self, channels) -> Optional[QualityStats]:
+        """
+        Control de calidad antes del DSP
+        Returns: estadísticas de la trama, o None si la trama se descarta
+        """
+        quality = self.quality_gate.check(channels)
+        self.frames_checked += 1
+        keep = self.quality_gate.keep(quality)
+        if not quality.valid:
+            if keep:
+                self.frames_flagged += 1
+            else:
+                self.frames_rejected += 1
+        quality.frames_checked = self.frames_checked
+        quality.frames_flagged = self.frames_flagged
+        quality.frames_rejected = self.frames_rejected
+        
+        if quality.valid:
+            return quality
+        print(f"[PROC] WARNING: Trama con problemas de calidad: {', '.join(quality.reasons)} "
+              f"({'marcada' if keep else 'descartada'}; marcadas {self.frames_flagged}, "
+              f"descartadas {self.frames_rejected} de {self.frames_checked})")
+        return quality if keep else None
+    
+    def _process_iq_data(self, data_I: ChannelData, data_Q: ChannelData,
+                         array_data: Optional[List[List[ChannelData]]] = None,
+                         quality: Optional[QualityStats] = None) -> RadarResults:
         """Procesa datos I/Q y calcula parámetros"""
         print("[PROC] Procesando señal compleja I+jQ...")
         
-        # Construir señales complejas
-        signal_up_complex = data_I.up_samples + 1j * data_Q.up_samples
-        signal_down_complex = data_I.down_samples + 1j * data_Q.down_samples
-        
-        # Análisis espectral
-        f_up, spec_up, _ = self.signal_processor.get_peak_freq_complex(signal_up_complex)
-        f_down, spec_down, _ = self.signal_processor.get_peak_freq_complex(signal_down_complex)
+        # Análisis espectral (preprocesado I/Q sin temporales)
+        array_mode = self.beamformer is not None and bool(array_data)
+        if array_mode:
+            # Una sola FFT batch de todos los canales; la referencia sale de la fila 0
+            array_spectra = self.signal_processor.range_spectra_iq(
+                [(data_I, data_Q)] + list(array_data), self._array_buffer
+            )
+            f_up, spec_up, _ = self.signal_processor.peak_freq_spectrum(array_spectra[0, 0])
+            f_down, spec_down, _ = self.signal_processor.peak_freq_spectrum(array_spectra[0, 1])
+        else:
+            f_up, spec_up, _ = self.signal_processor.get_peak_freq_iq(
+                data_I.up_samples, data_Q.up_samples
+            )
+            f_down, spec_down, _ = self.signal_processor.get_peak_freq_iq(
+                data_I.down_samples, data_Q.down_samples
+            )
         
         # Calcular parámetros físicos
         velocity = self.signal_processor.calculate_velocity(
@@ -85,12 +202,26 @@ class RadarProcessor:
             f_up , f_down
         )
         
+        # Todos los blancos: picos de cada rampa asociados por frecuencia
+        up_bins = self.signal_processor.find_peaks(
+            spec_up, self.config.max_targets, self.config.peak_threshold
+        )
+        down_bins = self.signal_processor.find_peaks(
+            spec_down, self.config.max_targets, self.config.peak_threshold
+        )
+        pairs = self._associate_peaks(up_bins, down_bins)
+        
+        # Ángulo de llegada de cada blanco (solo con arreglo)
+        azimuths, aoa_spectrum = [None] * len(pairs), None
+        if array_mode and pairs:
+            azimuths, aoa_spectrum = self._estimate_azimuth(array_spectra, pairs)
+        targets = [self._make_target(b_up, b_down, az) for (b_up, b_down), az in zip(pairs, azimuths)]
+        azimuth = targets[0].azimuth if targets else None
+        
         # Imprimir resultados
-        self._print_results(f_up, f_down, distance, velocity, direction)
+        self._print_results(f_up, f_down, distance, velocity, direction, targets)
         
         return RadarResults(
-            signal_up_complex=signal_up_complex,
-            signal_down_complex=signal_down_complex,
             spec_up=spec_up,
             spec_down=spec_down,
             f_up=f_up,
@@ -101,10 +232,61 @@ class RadarProcessor:
             I_up=data_I.up_samples,
             Q_up=data_Q.up_samples,
             I_down=data_I.down_samples,
-            Q_down=data_Q.down_samples
+            Q_down=data_Q.down_samples,
+            azimuth=azimuth,
+            aoa_spectrum=aoa_spectrum,
+            aoa_angles=self.beamformer.angles if self.beamformer is not None else None,
+            targets=targets,
+            quality=quality
+        )
+    
+    def _associate_peaks(self, up_bins: np.ndarray, down_bins: np.ndarray) -> List[Tuple[int, int]]:
+        """
+        Empareja picos de subida y bajada del mismo blanco
+        Del más fuerte al más débil, cada pico de subida toma el de bajada más cercano en |f|
+        """
+        freqs = np.abs(self.signal_processor.freqs)
+        available = list(down_bins)
+        pairs = []
+        for b_up in up_bins:
+            if not available:
+                break
+            nearest = int(np.argmin(np.abs(freqs[available] - freqs[b_up])))
+            pairs.append((int(b_up), int(available.pop(nearest))))
+        return pairs
+    
+    def _make_target(self, b_up: int, b_down: int, azimuth: Optional[float]) -> RadarTarget:
+        """Parámetros físicos de un par de picos"""
+        sp = self.signal_processor
+        f_up, f_down = float(abs(sp.freqs[b_up])), float(abs(sp.freqs[b_down]))
+        return RadarTarget(
+            f_up=f_up,
+            f_down=f_down,
+            distance=sp.calculate_distance(f_up, f_down, self.config.c, self.config.K),
+            velocity=sp.calculate_velocity(f_up, f_down, self.config.c, self.config.fc),
+            direction=sp.determine_direction(f_up, f_down),
+            azimuth=azimuth
         )
     
-    def _print_results(self, f_up, f_down, distance, velocity, direction):
+    def _estimate_azimuth(self, spectra: np.ndarray, pairs: List[Tuple[int, int]]):
+        """
+        Beamforming sobre todos los bins detectados de ambas rampas
+        spectra: salida de range_spectra_iq, forma (K, 2, fft_size)
+        Returns: (azimut por blanco, potencia angular total)
+        """
+        sp = self.signal_processor
+        n_channels, _, n_bins = spectra.shape
+        spectra = spectra.reshape(n_channels, 2 * n_bins)   # vista, sin copia
+        pairs = sp.unshifted_bins(np.asarray(pairs))
+        bins = np.concatenate([pairs[:, 0], n_bins + pairs[:, 1]])
+        
+        # Un solo estimate para los 2M bins; subida y bajada del mismo blanco se suman
+        _, power = self.beamformer.estimate(spectra, bins, period=n_bins)
+        power = power[:len(pairs)] + power[len(pairs):]          # (M, n_angles)
+        azimuths = [float(a) for a in self.beamformer.angles[np.argmax(power, axis=1)]]
+        return azimuths, power.sum(axis=0)
+    
+    def _print_results(self, f_up, f_down, distance, velocity, direction, targets=None):
         """Imprime resultados formateados"""
         print("\n" + "="*70)
         print("              RESULTADOS RADAR FMCW (I/Q)")
@@ -114,10 +296,19 @@ class RadarProcessor:
         print(f"\n{'DISTANCIA':^35} = {distance:10.4f} m")
         print(f"{'VELOCIDAD':^35} = {velocity:10.4f} m/s")
         print(f"{'DIRECCIÓN':^35} = {direction:^10}")
+        if targets and targets[0].azimuth is not None:
+            print("\nBlancos detectados:")
+            for k, target in enumerate(targets, start=1):
+                print(f"  #{k}: R = {target.distance:8.4f} m   v = {target.velocity:8.4f} m/s   "
+                      f"az = {target.azimuth:7.2f} °")
         print("="*70 + "\n")
     
     def _publish_results(self, results: RadarResults):
         """Envía resultados a visualización"""
+        if self.time_to_first_result is None:
+            self.time_to_first_result = time.perf_counter() - self.t_start
+            print(f"[PROC] Tiempo hasta el primer resultado: {self.time_to_first_result:.3f} s")
+
         try:
             self.queue_results.put(results, block=False)
         except queue.Full:
@@ -127,7 +318,9 @@ class RadarProcessor:
             except:
                 pass
 
-        # Enviar a display OLED (si está habilitado)  # ← AGREGAR TODO ESTE BLOQUE
+        # Enviar a display OLED (si está habilitado), solo tramas válidas
+        if results.quality is not None and not results.quality.valid:
+            return
         if self.queue_display is not None:
             try:
                 self.queue_display.put(results, block=False)
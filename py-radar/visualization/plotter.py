@@ -127,7 +127,6 @@ class RadarPlotter:
     def _plot_fft(self, results, chirp, subplot_idx):
         """Gráfica FFT"""
         plt.subplot(4, 3, subplot_idx)
-        signal = results.signal_up_complex if chirp == 'up' else results.signal_down_complex
         spec = results.spec_up if chirp == 'up' else results.spec_down
         freq = results.f_up if chirp == 'up' else results.f_down
         